@@ -0,0 +1,197 @@
+"""Measure integration import and config entry setup time.
+
+Home Assistant itself is replaced by the minimal stubs below, so only the
+cost of this integration is measured. voluptuous and pymodbus must be
+importable. Every sample runs in a fresh interpreter so that import costs
+are not hidden by the module cache.
+
+    python benchmarks/startup.py [--runs 15]
+"""
+import argparse
+import asyncio
+import importlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _install_homeassistant_stubs():
+    """Register just enough of homeassistant for the integration to load."""
+
+    def module(name, **attrs):
+        mod = types.ModuleType(name)
+        mod.__dict__.update(attrs)
+        sys.modules[name] = mod
+        return mod
+
+    class Entity:
+        pass
+
+    class HomeAssistantError(Exception):
+        pass
+
+    def passthrough(value):
+        return value
+
+    module("homeassistant")
+    module("homeassistant.components")
+    module(
+        "homeassistant.const",
+        CONF_NAME="name",
+        CONF_HOST="host",
+        CONF_PORT="port",
+        CONF_SCAN_INTERVAL="scan_interval",
+    )
+    module("homeassistant.core", HomeAssistant=object, callback=passthrough)
+    module("homeassistant.config_entries", ConfigEntry=object)
+    module("homeassistant.exceptions", HomeAssistantError=HomeAssistantError)
+    module("homeassistant.helpers")
+    module(
+        "homeassistant.helpers.config_validation",
+        string=str,
+        positive_int=int,
+        slug=str,
+    )
+    module("homeassistant.helpers.entity", Entity=Entity)
+    module(
+        "homeassistant.helpers.event",
+        async_track_time_interval=lambda hass, action, interval: lambda: None,
+    )
+    dt = module("homeassistant.util.dt", utcnow=None)
+    module("homeassistant.util", dt=dt, slugify=lambda text: text.lower())
+
+
+class FakeConfigEntry:
+    """Config entry with the fields the integration reads."""
+
+    def __init__(self):
+        self.data = {
+            "name": "solaredge",
+            "host": "127.0.0.1",
+            "port": 1,
+            "scan_interval": 30,
+        }
+        self.options = {}
+
+    def add_update_listener(self, listener):
+        return lambda: None
+
+
+async def _forward_entry_setup(entry, component):
+    pass
+
+
+class FakeHass:
+    """Event loop side of Home Assistant; executor jobs are queued."""
+
+    def __init__(self):
+        self.data = {}
+        self.config = types.SimpleNamespace(components=set())
+        self.services = types.SimpleNamespace(async_register=lambda *args, **kw: None)
+        self.config_entries = types.SimpleNamespace(
+            async_forward_entry_setup=_forward_entry_setup
+        )
+        self.executor_jobs = []
+
+    def async_create_task(self, coro):
+        # Platform forwarding is driven explicitly below.
+        coro.close()
+
+    def async_add_executor_job(self, target, *args):
+        self.executor_jobs.append((target, args))
+
+
+async def _setup(integration, sensor_platform, hass, entry):
+    entities = []
+    await integration.async_setup(hass, {})
+    await integration.async_setup_entry(hass, entry)
+    tracemalloc.start()
+    await sensor_platform.async_setup_entry(hass, entry, entities.extend)
+    entity_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    for entity in entities:
+        await entity.async_added_to_hass()
+    return entities, entity_bytes
+
+
+def run_once():
+    """Take one sample; must run in a fresh interpreter."""
+    sys.path.insert(0, ROOT)
+    _install_homeassistant_stubs()
+    result = {}
+
+    start = time.perf_counter()
+    integration = importlib.import_module("custom_components.solaredge_modbus")
+    sensor_platform = importlib.import_module("custom_components.solaredge_modbus.sensor")
+    result["import_ms"] = (time.perf_counter() - start) * 1000
+
+    hass = FakeHass()
+    start = time.perf_counter()
+    entities, entity_bytes = asyncio.run(
+        _setup(integration, sensor_platform, hass, FakeConfigEntry())
+    )
+    result["setup_loop_ms"] = (time.perf_counter() - start) * 1000
+    result["bytes_per_entity"] = entity_bytes / len(entities)
+    result["pymodbus_on_loop"] = "pymodbus" in sys.modules
+
+    start = time.perf_counter()
+    for target, args in hass.executor_jobs:
+        target(*args)
+    result["setup_executor_ms"] = (time.perf_counter() - start) * 1000
+
+    def read_properties():
+        for entity in entities:
+            entity.name
+            entity.unique_id
+            entity.unit_of_measurement
+            entity.icon
+            entity.state_attributes
+
+    result["properties_us"] = timeit.timeit(read_properties, number=1000) * 1e6 / 1000
+    result["entities"] = len(entities)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--once", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.once:
+        print(json.dumps(run_once()))
+        return
+
+    samples = [
+        json.loads(
+            subprocess.run(
+                [sys.executable, __file__, "--once"],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(args.runs)
+    ]
+    print(f"entities:                  {samples[0]['entities']}")
+    print(f"pymodbus imported on loop: {samples[0]['pymodbus_on_loop']}")
+    for key, label in (
+        ("import_ms", "integration import (ms)"),
+        ("setup_loop_ms", "entry setup on loop (ms)"),
+        ("setup_executor_ms", "entry setup in executor (ms)"),
+        ("bytes_per_entity", "memory per entity (B)"),
+        ("properties_us", "property reads, all entities (us)"),
+    ):
+        print(f"{label + ':':<34} {statistics.median(s[key] for s in samples):.1f}")
+
+
+if __name__ == "__main__":
+    main()
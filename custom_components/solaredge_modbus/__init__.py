@@ -2,21 +2,58 @@
 import asyncio
 import logging
 import threading
+import time
 from datetime import timedelta
 from typing import Optional
 
 import voluptuous as vol
-from pymodbus.client.sync import ModbusTcpClient
-from pymodbus.constants import Endian
-from pymodbus.payload import BinaryPayloadDecoder
 
 import homeassistant.helpers.config_validation as cv
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME, CONF_HOST, CONF_PORT, CONF_SCAN_INTERVAL
 from homeassistant.core import HomeAssistant
 from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.event import async_track_time_interval
-from .const import DOMAIN, DEFAULT_NAME, DEFAULT_SCAN_INTERVAL
+from homeassistant.util import dt as dt_util
+from .const import (
+    DOMAIN,
+    DEFAULT_NAME,
+    DEFAULT_SCAN_INTERVAL,
+    CONF_READ_INVERTER,
+    CONF_READ_METER1,
+    CONF_POWER_DEADBAND,
+    CONF_VOLTAGE_DEADBAND,
+    CONF_IMPORT_STATISTICS,
+    DEFAULT_READ_INVERTER,
+    DEFAULT_READ_METER1,
+    DEFAULT_DEADBAND,
+    DEFAULT_IMPORT_STATISTICS,
+    REGISTER_GROUP_INVERTER,
+    REGISTER_GROUP_METER1,
+    POWER_UNITS,
+    VOLTAGE_UNITS,
+    SENSOR_TYPES,
+    SERVICE_READ_REGISTERS,
+    EVENT_REGISTERS_READ,
+    ATTR_HUB,
+    ATTR_UNIT,
+    ATTR_ADDRESS,
+    ATTR_COUNT,
+    ATTR_DATA_TYPE,
+    ATTR_VALUES,
+    DATA_TYPE_INT16,
+    DATA_TYPE_UINT16,
+    DATA_TYPE_INT32,
+    DATA_TYPE_UINT32,
+    DATA_TYPE_FLOAT32,
+    DATA_TYPE_STRING,
+    DATA_TYPES,
+    READ_REGISTERS_MAX_COUNT,
+    READ_REGISTERS_CACHE_TTL,
+    READ_REGISTERS_MIN_INTERVAL,
+)
+from .energy_statistics import EnergyStatistics
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,12 +70,51 @@ CONFIG_SCHEMA = vol.Schema(
     {DOMAIN: vol.Schema({cv.slug: SOLAREDGE_MODBUS_SCHEMA})}, extra=vol.ALLOW_EXTRA
 )
 
+READ_REGISTERS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_HUB, default=DEFAULT_NAME): cv.string,
+        vol.Optional(ATTR_UNIT, default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=247)
+        ),
+        vol.Required(ATTR_ADDRESS): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=65535)
+        ),
+        vol.Optional(ATTR_COUNT, default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=READ_REGISTERS_MAX_COUNT)
+        ),
+        vol.Optional(ATTR_DATA_TYPE, default=DATA_TYPE_UINT16): vol.In(DATA_TYPES),
+    }
+)
+
 PLATFORMS = ["sensor"]
 
 
 async def async_setup(hass, config):
     """Set up the Solaredge modbus component."""
     hass.data[DOMAIN] = {}
+
+    async def async_read_registers(service):
+        """Read registers through the connection of a configured hub."""
+        hub_name = service.data[ATTR_HUB]
+        if hub_name not in hass.data[DOMAIN]:
+            raise HomeAssistantError(f"Unknown {DOMAIN} hub: {hub_name}")
+        hub = hass.data[DOMAIN][hub_name]["hub"]
+
+        values = await hass.async_add_executor_job(
+            hub.read_registers,
+            service.data[ATTR_UNIT],
+            service.data[ATTR_ADDRESS],
+            service.data[ATTR_COUNT],
+            service.data[ATTR_DATA_TYPE],
+        )
+        _LOGGER.debug("Read registers %s: %s", service.data, values)
+        hass.bus.async_fire(
+            EVENT_REGISTERS_READ, {**service.data, ATTR_VALUES: values}
+        )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_READ_REGISTERS, async_read_registers, schema=READ_REGISTERS_SCHEMA
+    )
     return True
 
 
@@ -52,9 +128,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     _LOGGER.debug("Setup %s.%s", DOMAIN, name)
 
     hub = SolaredgeModbusHub(hass, name, host, port, scan_interval)
+    hub.async_update_options(entry.options)
     """Register the hub."""
     hass.data[DOMAIN][name] = {
-        "hub": hub
+        "hub": hub,
+        "unsub_options_update_listener": entry.add_update_listener(
+            async_update_options
+        ),
     }
 
     for component in PLATFORMS:
@@ -77,22 +157,41 @@ async def async_unload_entry(hass, entry):
     if not unload_ok:
         return False
 
-    hass.data[DOMAIN].pop(entry.data["name"])
+    hub_data = hass.data[DOMAIN].pop(entry.data["name"])
+    hub_data["unsub_options_update_listener"]()
     return True
 
 
+async def async_update_options(hass, entry):
+    """Apply changed options to the running hub."""
+    hub = hass.data[DOMAIN][entry.data[CONF_NAME]]["hub"]
+    hub.async_update_options(entry.options)
+
+
 class SolaredgeModbusHub:
     """Thread safe wrapper class for pymodbus."""
 
     def __init__(self, hass, name, host, port, scan_interval):
         """Initialize the Modbus hub."""
         self._hass = hass
-        self._client = ModbusTcpClient(host=host, port=port)
+        self._host = host
+        self._port = port
+        self._client = None
+        self._connected = False
         self._lock = threading.Lock()
         self._name = name
         self._scan_interval = timedelta(seconds=scan_interval)
         self._unsub_interval_method = None
+        self._refreshing = False
         self._sensors = []
+        self._read_inverter = DEFAULT_READ_INVERTER
+        self._read_meter1 = DEFAULT_READ_METER1
+        self.deadbands = {}
+        self._energy_statistics = None
+        self.energy_counter_limits = {}
+        self._register_cache = {}
+        self._register_cache_lock = threading.Lock()
+        self._last_register_read = None
         self.data = {}
 
     @callback
@@ -100,7 +199,8 @@ class SolaredgeModbusHub:
         """Listen for data updates."""
         # This is the first sensor, set up interval.
         if not self._sensors:
-            self.connect()
+            # Connecting imports pymodbus and opens a socket, keep both off the loop.
+            self._hass.async_add_executor_job(self.connect)
             self._unsub_interval_method = async_track_time_interval(
                 self._hass, self.async_refresh_modbus_data, self._scan_interval
             )
@@ -116,18 +216,87 @@ class SolaredgeModbusHub:
             """stop the interval timer upon removal of last sensor"""
             self._unsub_interval_method()
             self._unsub_interval_method = None
-            self.close()
+            self._hass.async_add_executor_job(self.close)
+
+    @callback
+    def async_update_options(self, options):
+        """Apply options in place, keeping the connection and the sensors."""
+        scan_interval = timedelta(
+            seconds=options.get(CONF_SCAN_INTERVAL, self._scan_interval.total_seconds())
+        )
+        if scan_interval != self._scan_interval:
+            self._scan_interval = scan_interval
+            if self._unsub_interval_method is not None:
+                self._unsub_interval_method()
+                self._unsub_interval_method = async_track_time_interval(
+                    self._hass, self.async_refresh_modbus_data, self._scan_interval
+                )
+
+        self._read_inverter = options.get(CONF_READ_INVERTER, DEFAULT_READ_INVERTER)
+        self._read_meter1 = options.get(CONF_READ_METER1, DEFAULT_READ_METER1)
+        self._drop_disabled_groups()
+
+        power_deadband = options.get(CONF_POWER_DEADBAND, DEFAULT_DEADBAND)
+        voltage_deadband = options.get(CONF_VOLTAGE_DEADBAND, DEFAULT_DEADBAND)
+        self.deadbands = {unit: power_deadband for unit in POWER_UNITS}
+        self.deadbands.update({unit: voltage_deadband for unit in VOLTAGE_UNITS})
+
+        import_statistics = options.get(
+            CONF_IMPORT_STATISTICS, DEFAULT_IMPORT_STATISTICS
+        ) and "recorder" in self._hass.config.components
+        if not import_statistics:
+            self._energy_statistics = None
+        elif self._energy_statistics is None:
+            self._energy_statistics = EnergyStatistics(self._hass, self._name)
+            self._hass.async_create_task(
+                self._async_load_energy_statistics(self._energy_statistics)
+            )
+
+        for update_callback in self._sensors:
+            update_callback()
+
+    def _drop_disabled_groups(self):
+        """Remove the values of register groups that are no longer read."""
+        disabled_groups = set()
+        if not self._read_inverter:
+            disabled_groups.add(REGISTER_GROUP_INVERTER)
+        if not self._read_meter1:
+            disabled_groups.add(REGISTER_GROUP_METER1)
+        for key, description in SENSOR_TYPES.items():
+            if description.register_group in disabled_groups:
+                self.data.pop(key, None)
 
     async def async_refresh_modbus_data(self, _now: Optional[int] = None) -> None:
         """Time to update."""
         if not self._sensors:
             return
+        if self._refreshing:
+            _LOGGER.debug("Previous refresh of %s still running, skipping", self._name)
+            return
 
-        update_result = self.read_modbus_data()
+        self._refreshing = True
+        try:
+            update_result = await self._hass.async_add_executor_job(
+                self.read_modbus_data
+            )
+        finally:
+            self._refreshing = False
 
         if update_result:
             for update_callback in self._sensors:
                 update_callback()
+            if self._energy_statistics is not None and not (
+                self._energy_statistics.async_add_sample(
+                    dt_util.utcnow(), self.data, self.energy_counter_limits
+                )
+            ):
+                self._energy_statistics = None
+
+    async def _async_load_energy_statistics(self, energy_statistics):
+        """Load the statistics, dropping them if the recorder cannot take them."""
+        if not await energy_statistics.async_load():
+            if self._energy_statistics is energy_statistics:
+                self._energy_statistics = None
 
     @property
     def name(self):
@@ -137,12 +306,20 @@ class SolaredgeModbusHub:
     def close(self):
         """Disconnect client."""
         with self._lock:
-            self._client.close()
+            self._connected = False
+            if self._client is not None:
+                self._client.close()
 
     def connect(self):
         """Connect client."""
         with self._lock:
+            if self._client is None:
+                # pymodbus is only imported once the first sensor subscribes.
+                from pymodbus.client.sync import ModbusTcpClient
+
+                self._client = ModbusTcpClient(host=self._host, port=self._port)
             self._client.connect()
+            self._connected = True
 
     def read_holding_registers(self, unit, address, count):
         """Read holding registers."""
@@ -150,6 +327,79 @@ class SolaredgeModbusHub:
             kwargs = {"unit": unit} if unit else {}
             return self._client.read_holding_registers(address, count, **kwargs)
 
+    def read_registers(self, unit, address, count, data_type):
+        """Read and decode registers on request, served from a short-lived cache.
+
+        Reads that miss the cache are rate limited so that they cannot starve
+        the regular poll of the shared connection.
+        """
+        from pymodbus.constants import Endian
+        from pymodbus.exceptions import ModbusException
+        from pymodbus.payload import BinaryPayloadDecoder
+
+        if data_type in (DATA_TYPE_INT32, DATA_TYPE_UINT32, DATA_TYPE_FLOAT32) and count % 2:
+            raise HomeAssistantError(f"{data_type} values need an even register count")
+        if address + count > 65536:
+            raise HomeAssistantError(
+                f"Reading {count} register(s) at {address} runs past register 65535"
+            )
+
+        cache_key = (unit, address, count, data_type)
+        with self._register_cache_lock:
+            now = time.monotonic()
+            cached = self._register_cache.get(cache_key)
+            if cached is not None and now - cached[0] < READ_REGISTERS_CACHE_TTL:
+                return cached[1]
+            if (
+                self._last_register_read is not None
+                and now - self._last_register_read < READ_REGISTERS_MIN_INTERVAL
+            ):
+                raise HomeAssistantError(
+                    f"Register reads on {self._name} are limited to one per "
+                    f"{READ_REGISTERS_MIN_INTERVAL} second(s)"
+                )
+            if not self._connected:
+                raise HomeAssistantError(f"Hub {self._name} is not connected")
+            self._last_register_read = now
+
+            try:
+                result = self.read_holding_registers(unit, address, count)
+            except ModbusException as err:
+                raise HomeAssistantError(
+                    f"Reading {count} register(s) at {address} failed: {err}"
+                ) from err
+            if result.isError():
+                raise HomeAssistantError(
+                    f"Reading {count} register(s) at {address} failed: {result}"
+                )
+
+            decoder = BinaryPayloadDecoder.fromRegisters(
+                result.registers, byteorder=Endian.Big
+            )
+            if data_type == DATA_TYPE_STRING:
+                values = (
+                    decoder.decode_string(count * 2)
+                    .decode("utf-8", "ignore")
+                    .rstrip("\x00")
+                )
+            else:
+                decode, width = {
+                    DATA_TYPE_INT16: (decoder.decode_16bit_int, 1),
+                    DATA_TYPE_UINT16: (decoder.decode_16bit_uint, 1),
+                    DATA_TYPE_INT32: (decoder.decode_32bit_int, 2),
+                    DATA_TYPE_UINT32: (decoder.decode_32bit_uint, 2),
+                    DATA_TYPE_FLOAT32: (decoder.decode_32bit_float, 2),
+                }[data_type]
+                values = [decode() for _ in range(count // width)]
+
+            self._register_cache = {
+                key: entry
+                for key, entry in self._register_cache.items()
+                if now - entry[0] < READ_REGISTERS_CACHE_TTL
+            }
+            self._register_cache[cache_key] = (now, values)
+            return values
+
     def calculate_value(self, value, sf):
         return value * 10 ** sf
 
@@ -218,11 +468,21 @@ class SolaredgeModbusHub:
         return True
 
     def read_modbus_data(self):
-        rvInverter = False
-        rvMeter1 = False
-        inverter_data = self.read_holding_registers(unit=1, address=40071, count=38)
-        meter1_data = self.read_holding_registers(unit=1, address=40190, count=53)
-        if not inverter_data.isError():
+        from pymodbus.constants import Endian
+        from pymodbus.payload import BinaryPayloadDecoder
+
+        if not self._connected:
+            return False
+
+        rvInverter = not self._read_inverter
+        rvMeter1 = not self._read_meter1
+        inverter_data = None
+        meter1_data = None
+        if self._read_inverter:
+            inverter_data = self.read_holding_registers(unit=1, address=40071, count=38)
+        if self._read_meter1:
+            meter1_data = self.read_holding_registers(unit=1, address=40190, count=53)
+        if inverter_data is not None and not inverter_data.isError():
             decoder = BinaryPayloadDecoder.fromRegisters(inverter_data.registers, byteorder=Endian.Big)
             accurrent = decoder.decode_16bit_uint()
             accurrenta = decoder.decode_16bit_uint()
@@ -297,6 +557,7 @@ class SolaredgeModbusHub:
             acenergy = self.calculate_value(acenergy, acenergysf)
 
             self.data["acenergy"] = round(acenergy * 0.001, 3)
+            self.energy_counter_limits["acenergy"] = self.calculate_value(2 ** 32, acenergysf) * 0.001
 
             dccurrent = decoder.decode_16bit_uint()
             dccurrentsf = decoder.decode_16bit_int()
@@ -335,7 +596,7 @@ class SolaredgeModbusHub:
             self.data["statusvendor"] = statusvendor
 
             rvInverter = True
-        if not meter1_data.isError():
+        if meter1_data is not None and not meter1_data.isError():
             decoder = BinaryPayloadDecoder.fromRegisters(meter1_data.registers, byteorder=Endian.Big)
             m1accurrent =   decoder.decode_16bit_int()
             m1accurrenta =  decoder.decode_16bit_int()
@@ -485,5 +746,10 @@ class SolaredgeModbusHub:
             self.data["m1acimporteda"] = round(m1acimporteda * 0.001, 3)
             self.data["m1acimportedb"] = round(m1acimportedb * 0.001, 3)
             self.data["m1acimportedc"] = round(m1acimportedc * 0.001, 3)
+            self.energy_counter_limits["m1acexported"] = self.calculate_value(2 ** 32, m1acenergysf) * 0.001
+            self.energy_counter_limits["m1acimported"] = self.energy_counter_limits["m1acexported"]
             rvMeter1 = True
+        # A poll that was running while a group got disabled may have
+        # written its values back after the options flow removed them.
+        self._drop_disabled_groups()
         return rvInverter and rvMeter1
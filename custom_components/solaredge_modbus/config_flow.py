@@ -5,7 +5,21 @@ import voluptuous as vol
 
 from homeassistant import config_entries, exceptions
 from homeassistant.const import CONF_NAME, CONF_HOST, CONF_PORT, CONF_SCAN_INTERVAL
-from .const import DOMAIN, DEFAULT_NAME, DEFAULT_SCAN_INTERVAL, DEFAULT_PORT
+from .const import (
+    DOMAIN,
+    DEFAULT_NAME,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_PORT,
+    CONF_READ_INVERTER,
+    CONF_READ_METER1,
+    CONF_POWER_DEADBAND,
+    CONF_VOLTAGE_DEADBAND,
+    CONF_IMPORT_STATISTICS,
+    DEFAULT_READ_INVERTER,
+    DEFAULT_READ_METER1,
+    DEFAULT_DEADBAND,
+    DEFAULT_IMPORT_STATISTICS,
+)
 from homeassistant.core import HomeAssistant, callback
 
 DATA_SCHEMA = vol.Schema(
@@ -38,6 +52,12 @@ class SolaredgeModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
     CONNECTION_CLASS = config_entries.CONN_CLASS_LOCAL_POLL
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        """Get the options flow for this handler."""
+        return SolaredgeModbusOptionsFlow(config_entry)
+
     def _host_in_configuration_exists(self, host) -> bool:
         """Return True if host exists in configuration."""
         if host in solaredge_modbus_entries(self.hass):
@@ -64,3 +84,50 @@ class SolaredgeModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="user", data_schema=DATA_SCHEMA, errors=errors
         )
 
+
+class SolaredgeModbusOptionsFlow(config_entries.OptionsFlow):
+    """Solaredge Modbus options flow."""
+
+    def __init__(self, config_entry):
+        """Initialize options flow."""
+        self.config_entry = config_entry
+
+    async def async_step_init(self, user_input=None):
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        scan_interval = options.get(
+            CONF_SCAN_INTERVAL, self.config_entry.data[CONF_SCAN_INTERVAL]
+        )
+        options_schema = vol.Schema(
+            {
+                vol.Optional(CONF_SCAN_INTERVAL, default=scan_interval): vol.All(
+                    int, vol.Range(min=1)
+                ),
+                vol.Optional(
+                    CONF_READ_INVERTER,
+                    default=options.get(CONF_READ_INVERTER, DEFAULT_READ_INVERTER),
+                ): bool,
+                vol.Optional(
+                    CONF_READ_METER1,
+                    default=options.get(CONF_READ_METER1, DEFAULT_READ_METER1),
+                ): bool,
+                vol.Optional(
+                    CONF_POWER_DEADBAND,
+                    default=options.get(CONF_POWER_DEADBAND, DEFAULT_DEADBAND),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_VOLTAGE_DEADBAND,
+                    default=options.get(CONF_VOLTAGE_DEADBAND, DEFAULT_DEADBAND),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_IMPORT_STATISTICS,
+                    default=options.get(
+                        CONF_IMPORT_STATISTICS, DEFAULT_IMPORT_STATISTICS
+                    ),
+                ): bool,
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=options_schema)
@@ -1,3 +1,5 @@
+from typing import NamedTuple, Optional
+
 DOMAIN = "solaredge_modbus"
 DEFAULT_NAME = "solaredge"
 DEFAULT_SCAN_INTERVAL = 30
@@ -5,73 +7,122 @@ DEFAULT_PORT = 1502
 CONF_SOLAREDGE_HUB = "solaredge_hub"
 ATTR_STATUS_DESCRIPTION = "status_description"
 ATTR_MANUFACTURER = "Solaredge"
+CONF_READ_INVERTER = "read_inverter"
+CONF_READ_METER1 = "read_meter1"
+CONF_POWER_DEADBAND = "power_deadband"
+CONF_VOLTAGE_DEADBAND = "voltage_deadband"
+CONF_IMPORT_STATISTICS = "import_statistics"
+DEFAULT_READ_INVERTER = True
+DEFAULT_READ_METER1 = True
+DEFAULT_DEADBAND = 0
+DEFAULT_IMPORT_STATISTICS = True
+REGISTER_GROUP_INVERTER = "inverter"
+REGISTER_GROUP_METER1 = "meter1"
+POWER_UNITS = ("W", "VA", "VAR")
+VOLTAGE_UNITS = ("V",)
+ENERGY_COUNTER_KEYS = ("acenergy", "m1acexported", "m1acimported")
+SERVICE_READ_REGISTERS = "read_registers"
+EVENT_REGISTERS_READ = "solaredge_modbus_registers_read"
+ATTR_HUB = "hub"
+ATTR_UNIT = "unit"
+ATTR_ADDRESS = "address"
+ATTR_COUNT = "count"
+ATTR_DATA_TYPE = "data_type"
+ATTR_VALUES = "values"
+DATA_TYPE_INT16 = "int16"
+DATA_TYPE_UINT16 = "uint16"
+DATA_TYPE_INT32 = "int32"
+DATA_TYPE_UINT32 = "uint32"
+DATA_TYPE_FLOAT32 = "float32"
+DATA_TYPE_STRING = "string"
+DATA_TYPES = (
+    DATA_TYPE_INT16,
+    DATA_TYPE_UINT16,
+    DATA_TYPE_INT32,
+    DATA_TYPE_UINT32,
+    DATA_TYPE_FLOAT32,
+    DATA_TYPE_STRING,
+)
+READ_REGISTERS_MAX_COUNT = 125
+READ_REGISTERS_CACHE_TTL = 5
+READ_REGISTERS_MIN_INTERVAL = 1
 
-SENSOR_TYPES = {
-    "AC_Current": ["AC Current", "accurrent", "A", "mdi:current-ac"],
-    "AC_CurrentA": ["AC Current A", "accurrenta", "A", "mdi:current-ac"],
-    "AC_CurrentB": ["AC Current B", "accurrentb", "A", "mdi:current-ac"],
-    "AC_CurrentC": ["AC Current C", "accurrentc", "A", "mdi:current-ac"],
-    "AC_VoltageAB": ["AC Voltage AB", "acvoltageab", "V", None],
-    "AC_VoltageBC": ["AC Voltage BC", "acvoltagebc", "V", None],
-    "AC_VoltageCA": ["AC Voltage CA", "acvoltageca", "V", None],
-    "AC_VoltageAN": ["AC Voltage AN", "acvoltagean", "V", None],
-    "AC_VoltageBN": ["AC Voltage BN", "acvoltagebn", "V", None],
-    "AC_VoltageCN": ["AC Voltage CN", "acvoltagecn", "V", None],
-    "AC_Power": ["AC Power", "acpower", "W", "mdi:solar-power"],
-    "AC_Frequency": ["AC Frequency", "acfreq", "Hz", None],
-    "AC_VA": ["AC VA", "acva", "VA", None],
-    "AC_VAR": ["AC VAR", "acvar", "VAR", None],
-    "AC_PF": ["AC PF", "acpf", "%", None],
-    "AC_Energy_KWH": ["AC Energy KWH", "acenergy", "kWh", "mdi:solar-power"],
-    "DC_Current": ["DC Current", "dccurrent", "A", "mdi:current-dc"],
-    "DC_Voltage": ["DC Voltage", "dcvoltage", "V", None],
-    "DC_Power": ["DC Power", "dcpower", "W", "mdi:solar-power"],
-    "Temp_Sink": ["Temp Sink", "tempsink", "°C", None],
-    "Status": ["Status", "status", None, None],
-    "Status_Vendor": ["Status Vendor", "statusvendor", None, None],
 
-    
-    "M1_AC_Current":  ["Meter 1 AC Current",   "m1accurrent",  "A", "mdi:current-ac"],
-    "M1_AC_CurrentA": ["Meter 1 AC Current A", "m1accurrenta", "A", "mdi:current-ac"],
-    "M1_AC_CurrentB": ["Meter 1 AC Current B", "m1accurrentb", "A", "mdi:current-ac"],
-    "M1_AC_CurrentC": ["Meter 1 AC Current C", "m1accurrentc", "A", "mdi:current-ac"],
-    "M1_AC_VoltageLL": ["Meter 1 AC Voltage LL", "m1acvoltagell", "V", None],
-    "M1_AC_VoltageAB": ["Meter 1 AC Voltage AB", "m1acvoltageab", "V", None],
-    "M1_AC_VoltageBC": ["Meter 1 AC Voltage BC", "m1acvoltagebc", "V", None],
-    "M1_AC_VoltageCA": ["Meter 1 AC Voltage CA", "m1acvoltageca", "V", None],
-    "M1_AC_VoltageLN": ["Meter 1 AC Voltage LN", "m1acvoltageln", "V", None],
-    "M1_AC_VoltageAN": ["Meter 1 AC Voltage AN", "m1acvoltagean", "V", None],
-    "M1_AC_VoltageBN": ["Meter 1 AC Voltage BN", "m1acvoltagebn", "V", None],
-    "M1_AC_VoltageCN": ["Meter 1 AC Voltage CN", "m1acvoltagecn", "V", None],
-    "M1_AC_Frequency": ["Meter 1 AC Frequency", "m1acfreq", "Hz", None],
-    "M1_AC_Power":  ["Meter 1 AC Power",   "m1acpower",  "W", "mdi:flash"],
-    "M1_AC_PowerA": ["Meter 1 AC Power A", "m1acpowera", "W", "mdi:flash"],
-    "M1_AC_PowerB": ["Meter 1 AC Power B", "m1acpowerb", "W", "mdi:flash"],
-    "M1_AC_PowerC": ["Meter 1 AC Power C", "m1acpowerc", "W", "mdi:flash"],
-    "M1_AC_VA":  ["Meter 1 AC Apparent Power",   "m1acva",  "VA", "mdi:flash"],
-    "M1_AC_VAA": ["Meter 1 AC Apparent Power A", "m1acvaa", "VA", "mdi:flash"],
-    "M1_AC_VAB": ["Meter 1 AC Apparent Power B", "m1acvab", "VA", "mdi:flash"],
-    "M1_AC_VAC": ["Meter 1 AC Apparent Power C", "m1acvac", "VA", "mdi:flash"],
-    "M1_AC_VAR":  ["Meter 1 AC Reactive Power",   "m1acvar",  "VAR", "mdi:flash"],
-    "M1_AC_VARA": ["Meter 1 AC Reactive Power A", "m1acvara", "VAR", "mdi:flash"],
-    "M1_AC_VARB": ["Meter 1 AC Reactive Power B", "m1acvarb", "VAR", "mdi:flash"],
-    "M1_AC_VARC": ["Meter 1 AC Reactive Power C", "m1acvarc", "VAR", "mdi:flash"],
-    "M1_AC_PF":  ["Meter 1 AC Power Factor",   "m1acpf",  "%", "mdi:flash"],
-    "M1_AC_PFA": ["Meter 1 AC Power Factor A", "m1acpfa", "%", "mdi:flash"],
-    "M1_AC_PFB": ["Meter 1 AC Power Factor B", "m1acpfb", "%", "mdi:flash"],
-    "M1_AC_PFC": ["Meter 1 AC Power Factor C", "m1acpfc", "%", "mdi:flash"],
-    "M1_AC_PF":  ["Meter 1 AC Power Factor",   "m1acpf",  "%", "mdi:flash"],
-    "M1_AC_PFA": ["Meter 1 AC Power Factor A", "m1acpfa", "%", "mdi:flash"],
-    "M1_AC_PFB": ["Meter 1 AC Power Factor B", "m1acpfb", "%", "mdi:flash"],
-    "M1_AC_PFC": ["Meter 1 AC Power Factor C", "m1acpfc", "%", "mdi:flash"],
-    "M1_AC_EXPORTED":  ["Meter 1 Exported Real Energy",   "m1acexported",  "kWh", "mdi:arrow-expand-all"],
-    "M1_AC_EXPORTEDA": ["Meter 1 Exported Real Energy A", "m1acexporteda", "kWh", "mdi:arrow-expand-all"],
-    "M1_AC_EXPORTEDB": ["Meter 1 Exported Real Energy B", "m1acexportedb", "kWh", "mdi:arrow-expand-all"],
-    "M1_AC_EXPORTEDC": ["Meter 1 Exported Real Energy C", "m1acexportedc", "kWh", "mdi:arrow-expand-all"],
-    "M1_AC_IMPORTED":  ["Meter 1 Imported Real Energy",   "m1acimported",  "kWh", "mdi:arrow-collapse-all"],
-    "M1_AC_IMPORTEDA": ["Meter 1 Imported Real Energy A", "m1acimporteda", "kWh", "mdi:arrow-collapse-all"],
-    "M1_AC_IMPORTEDB": ["Meter 1 Imported Real Energy B", "m1acimportedb", "kWh", "mdi:arrow-collapse-all"],
-    "M1_AC_IMPORTEDC": ["Meter 1 Imported Real Energy C", "m1acimportedc", "kWh", "mdi:arrow-collapse-all"]
+class SolarEdgeSensorDescription(NamedTuple):
+    """Immutable description of a sensor exposed by the hub."""
+
+    key: str
+    name: str
+    unit: Optional[str]
+    icon: Optional[str]
+    register_group: str = REGISTER_GROUP_INVERTER
+
+
+SENSOR_DESCRIPTIONS = (
+    SolarEdgeSensorDescription("accurrent", "AC Current", "A", "mdi:current-ac"),
+    SolarEdgeSensorDescription("accurrenta", "AC Current A", "A", "mdi:current-ac"),
+    SolarEdgeSensorDescription("accurrentb", "AC Current B", "A", "mdi:current-ac"),
+    SolarEdgeSensorDescription("accurrentc", "AC Current C", "A", "mdi:current-ac"),
+    SolarEdgeSensorDescription("acvoltageab", "AC Voltage AB", "V", None),
+    SolarEdgeSensorDescription("acvoltagebc", "AC Voltage BC", "V", None),
+    SolarEdgeSensorDescription("acvoltageca", "AC Voltage CA", "V", None),
+    SolarEdgeSensorDescription("acvoltagean", "AC Voltage AN", "V", None),
+    SolarEdgeSensorDescription("acvoltagebn", "AC Voltage BN", "V", None),
+    SolarEdgeSensorDescription("acvoltagecn", "AC Voltage CN", "V", None),
+    SolarEdgeSensorDescription("acpower", "AC Power", "W", "mdi:solar-power"),
+    SolarEdgeSensorDescription("acfreq", "AC Frequency", "Hz", None),
+    SolarEdgeSensorDescription("acva", "AC VA", "VA", None),
+    SolarEdgeSensorDescription("acvar", "AC VAR", "VAR", None),
+    SolarEdgeSensorDescription("acpf", "AC PF", "%", None),
+    SolarEdgeSensorDescription("acenergy", "AC Energy KWH", "kWh", "mdi:solar-power"),
+    SolarEdgeSensorDescription("dccurrent", "DC Current", "A", "mdi:current-dc"),
+    SolarEdgeSensorDescription("dcvoltage", "DC Voltage", "V", None),
+    SolarEdgeSensorDescription("dcpower", "DC Power", "W", "mdi:solar-power"),
+    SolarEdgeSensorDescription("tempsink", "Temp Sink", "°C", None),
+    SolarEdgeSensorDescription("status", "Status", None, None),
+    SolarEdgeSensorDescription("statusvendor", "Status Vendor", None, None),
+
+    SolarEdgeSensorDescription("m1accurrent", "Meter 1 AC Current", "A", "mdi:current-ac", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1accurrenta", "Meter 1 AC Current A", "A", "mdi:current-ac", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1accurrentb", "Meter 1 AC Current B", "A", "mdi:current-ac", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1accurrentc", "Meter 1 AC Current C", "A", "mdi:current-ac", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acvoltagell", "Meter 1 AC Voltage LL", "V", None, REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acvoltageab", "Meter 1 AC Voltage AB", "V", None, REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acvoltagebc", "Meter 1 AC Voltage BC", "V", None, REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acvoltageca", "Meter 1 AC Voltage CA", "V", None, REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acvoltageln", "Meter 1 AC Voltage LN", "V", None, REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acvoltagean", "Meter 1 AC Voltage AN", "V", None, REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acvoltagebn", "Meter 1 AC Voltage BN", "V", None, REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acvoltagecn", "Meter 1 AC Voltage CN", "V", None, REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acfreq", "Meter 1 AC Frequency", "Hz", None, REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acpower", "Meter 1 AC Power", "W", "mdi:flash", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acpowera", "Meter 1 AC Power A", "W", "mdi:flash", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acpowerb", "Meter 1 AC Power B", "W", "mdi:flash", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acpowerc", "Meter 1 AC Power C", "W", "mdi:flash", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acva", "Meter 1 AC Apparent Power", "VA", "mdi:flash", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acvaa", "Meter 1 AC Apparent Power A", "VA", "mdi:flash", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acvab", "Meter 1 AC Apparent Power B", "VA", "mdi:flash", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acvac", "Meter 1 AC Apparent Power C", "VA", "mdi:flash", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acvar", "Meter 1 AC Reactive Power", "VAR", "mdi:flash", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acvara", "Meter 1 AC Reactive Power A", "VAR", "mdi:flash", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acvarb", "Meter 1 AC Reactive Power B", "VAR", "mdi:flash", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acvarc", "Meter 1 AC Reactive Power C", "VAR", "mdi:flash", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acpf", "Meter 1 AC Power Factor", "%", "mdi:flash", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acpfa", "Meter 1 AC Power Factor A", "%", "mdi:flash", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acpfb", "Meter 1 AC Power Factor B", "%", "mdi:flash", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acpfc", "Meter 1 AC Power Factor C", "%", "mdi:flash", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acexported", "Meter 1 Exported Real Energy", "kWh", "mdi:arrow-expand-all", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acexporteda", "Meter 1 Exported Real Energy A", "kWh", "mdi:arrow-expand-all", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acexportedb", "Meter 1 Exported Real Energy B", "kWh", "mdi:arrow-expand-all", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acexportedc", "Meter 1 Exported Real Energy C", "kWh", "mdi:arrow-expand-all", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acimported", "Meter 1 Imported Real Energy", "kWh", "mdi:arrow-collapse-all", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acimporteda", "Meter 1 Imported Real Energy A", "kWh", "mdi:arrow-collapse-all", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acimportedb", "Meter 1 Imported Real Energy B", "kWh", "mdi:arrow-collapse-all", REGISTER_GROUP_METER1),
+    SolarEdgeSensorDescription("m1acimportedc", "Meter 1 Imported Real Energy C", "kWh", "mdi:arrow-collapse-all", REGISTER_GROUP_METER1),
+)
+
+SENSOR_TYPES = {
+    description.key: description for description in SENSOR_DESCRIPTIONS
 }
 
 DEVICE_STATUSSES = {
@@ -0,0 +1,190 @@
+"""Hourly long-term statistics for the SolarEdge energy counters."""
+import logging
+from datetime import datetime, timedelta
+
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+
+from .const import DOMAIN, SENSOR_TYPES, ENERGY_COUNTER_KEYS
+
+_LOGGER = logging.getLogger(__name__)
+
+HOUR = timedelta(hours=1)
+
+
+def _start_of_hour(moment):
+    """Return the start of the hour containing moment."""
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+class EnergyCounter:
+    """Turn samples of one cumulative counter into hourly statistic rows."""
+
+    def __init__(self, statistic_id):
+        """Initialize the counter."""
+        self.statistic_id = statistic_id
+        self._value = None
+        self._time = None
+        self._sum = 0.0
+
+    def restore(self, start, state, total):
+        """Continue from the last imported hour."""
+        self._value = state
+        self._time = start + HOUR
+        self._sum = total
+
+    def add_sample(self, now, value, limit=None):
+        """Add a counter sample and return the rows of the hours it completes.
+
+        A counter that decreases was either reset or rolled over. It counts
+        as a rollover when it was in the upper half of its range, otherwise
+        the new value is taken as the energy since the reset. A delta that
+        spans several hours, e.g. after an outage, is spread over them in
+        proportion to time, and so is the state of those hours. A reset is
+        assumed to have happened at the start of such a gap.
+        """
+        if self._value is None:
+            self._value = value
+            self._time = now
+            return []
+        if now <= self._time:
+            return []
+        if value == 0 and self._value > 0:
+            # The inverter briefly reports zero while starting up.
+            return []
+
+        base = self._value
+        if value >= self._value:
+            delta = value - self._value
+        elif limit is not None and self._value > limit / 2:
+            delta = limit - self._value + value
+        else:
+            base = 0.0
+            delta = value
+
+        rows = []
+        counted = 0.0
+        elapsed = (now - self._time).total_seconds()
+        hour_start = _start_of_hour(self._time)
+        while hour_start + HOUR <= now:
+            hour_end = hour_start + HOUR
+            share = (hour_end - max(hour_start, self._time)).total_seconds()
+            portion = delta * share / elapsed
+            self._sum += portion
+            counted += portion
+            state = base + counted
+            if limit is not None and state >= limit:
+                state -= limit
+            rows.append(
+                {
+                    "start": hour_start,
+                    "state": round(state, 3),
+                    "sum": round(self._sum, 3),
+                }
+            )
+            delta -= portion
+            elapsed -= share
+            self._time = hour_end
+            hour_start = hour_end
+
+        self._sum += delta
+        self._value = value
+        self._time = now
+        return rows
+
+
+class EnergyStatistics:
+    """Import the hub energy counters as external long-term statistics."""
+
+    def __init__(self, hass, hub_name):
+        """Initialize the statistics for a hub."""
+        self._hass = hass
+        self._hub_name = hub_name
+        self._loaded = False
+        self._async_add_external_statistics = None
+        self._counters = {
+            key: EnergyCounter(f"{DOMAIN}:{slugify(hub_name)}_{key}")
+            for key in ENERGY_COUNTER_KEYS
+        }
+
+    async def async_load(self):
+        """Resume every counter from the last hour in the recorder.
+
+        Returns False when the recorder cannot provide the statistics API.
+        """
+        try:
+            from homeassistant.components.recorder import get_instance
+            from homeassistant.components.recorder.statistics import (
+                async_add_external_statistics,
+                get_last_statistics,
+            )
+        except ImportError:
+            _LOGGER.error(
+                "This Home Assistant version cannot import long-term statistics, "
+                "disabled for %s",
+                self._hub_name,
+            )
+            return False
+
+        try:
+            for counter in self._counters.values():
+                last = await get_instance(self._hass).async_add_executor_job(
+                    get_last_statistics,
+                    self._hass,
+                    1,
+                    counter.statistic_id,
+                    True,
+                    {"state", "sum"},
+                )
+                if counter.statistic_id not in last:
+                    continue
+                row = last[counter.statistic_id][0]
+                start = row["start"]
+                if not isinstance(start, datetime):
+                    start = dt_util.utc_from_timestamp(start)
+                counter.restore(start, row["state"], row["sum"])
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception(
+                "Reading the last long-term statistics failed, disabled for %s",
+                self._hub_name,
+            )
+            return False
+
+        self._async_add_external_statistics = async_add_external_statistics
+        self._loaded = True
+        return True
+
+    @callback
+    def async_add_sample(self, now, data, limits):
+        """Feed decoded counters and import the hours they complete.
+
+        Returns False when importing failed and should not be retried.
+        """
+        if not self._loaded:
+            return True
+        for key, counter in self._counters.items():
+            if data.get(key) is None:
+                continue
+            rows = counter.add_sample(now, data[key], limits.get(key))
+            if not rows:
+                continue
+            description = SENSOR_TYPES[key]
+            metadata = {
+                "has_mean": False,
+                "has_sum": True,
+                "name": f"{self._hub_name} ({description.name})",
+                "source": DOMAIN,
+                "statistic_id": counter.statistic_id,
+                "unit_of_measurement": description.unit,
+            }
+            _LOGGER.debug("Importing %d hour(s) for %s", len(rows), counter.statistic_id)
+            try:
+                self._async_add_external_statistics(self._hass, metadata, rows)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Importing long-term statistics failed, disabled for %s",
+                    self._hub_name,
+                )
+                return False
+        return True
@@ -7,6 +7,12 @@ from homeassistant.core import callback
 
 _LOGGER = logging.getLogger(__name__)
 
+STATUS_SENSOR_KEYS = ("status", "statusvendor")
+STATUS_ATTRIBUTES = {
+    status: {ATTR_STATUS_DESCRIPTION: description}
+    for status, description in DEVICE_STATUSSES.items()
+}
+
 
 async def async_setup_entry(hass, entry, async_add_entities):
     hub_name = entry.data[CONF_NAME]
@@ -19,16 +25,8 @@ async def async_setup_entry(hass, entry, async_add_entities):
     }
 
     entities = []
-    for sensor_info in SENSOR_TYPES.values():
-        sensor = SolarEdgeSensor(
-            hub_name,
-            hub,
-            device_info,
-            sensor_info[0],
-            sensor_info[1],
-            sensor_info[2],
-            sensor_info[3],
-        )
+    for description in SENSOR_TYPES.values():
+        sensor = SolarEdgeSensor(hub, device_info, description)
         entities.append(sensor)
     async_add_entities(entities)
     return True
@@ -37,62 +35,69 @@ async def async_setup_entry(hass, entry, async_add_entities):
 class SolarEdgeSensor(Entity):
     """Representation of an SolarEdge Modbus sensor."""
 
-    def __init__(self, platform_name, hub, device_info, name, key, unit, icon):
+    def __init__(self, hub, device_info, description):
         """Initialize the sensor."""
-        self._platform_name = platform_name
         self._hub = hub
-        self._key = key
-        self._name = name
-        self._unit_of_measurement = unit
-        self._icon = icon
+        self._description = description
         self._device_info = device_info
+        self._state = None
 
     async def async_added_to_hass(self):
         """Register callbacks."""
         self._hub.async_add_solaredge_sensor(self._modbus_data_updated)
+        self._state = self._hub.data.get(self._description.key)
 
     async def async_will_remove_from_hass(self) -> None:
         self._hub.async_remove_solaredge_sensor(self._modbus_data_updated)
 
     @callback
     def _modbus_data_updated(self):
-        self.async_write_ha_state()
+        if self._update_state():
+            self.async_write_ha_state()
 
     @callback
     def _update_state(self):
-        if self._key in self._hub.data:
-            self._state = self._hub.data[self._key]
+        """Take the hub value unless it lies within the configured deadband."""
+        value = self._hub.data.get(self._description.key)
+        deadband = self._hub.deadbands.get(self._description.unit)
+        if (
+            deadband
+            and value is not None
+            and self._state is not None
+            and abs(value - self._state) < deadband
+        ):
+            return False
+        self._state = value
+        return True
 
     @property
     def name(self):
         """Return the name."""
-        return f"{self._platform_name} ({self._name})"
+        return f"{self._hub.name} ({self._description.name})"
 
     @property
     def unique_id(self) -> Optional[str]:
-        return f"{self._platform_name}_{self._key}"
+        return f"{self._hub.name}_{self._description.key}"
 
     @property
     def unit_of_measurement(self):
         """Return the unit of measurement."""
-        return self._unit_of_measurement
+        return self._description.unit
 
     @property
     def icon(self):
         """Return the sensor icon."""
-        return self._icon
+        return self._description.icon
 
     @property
     def state(self):
         """Return the state of the sensor."""
-        if self._key in self._hub.data:
-            return self._hub.data[self._key]
+        return self._state
 
     @property
     def state_attributes(self) -> Optional[Dict[str, Any]]:
-        if self._key in ["status", "statusvendor"]:
-            if self.state in DEVICE_STATUSSES:
-                return {ATTR_STATUS_DESCRIPTION: DEVICE_STATUSSES[self.state]}
+        if self._description.key in STATUS_SENSOR_KEYS:
+            return STATUS_ATTRIBUTES.get(self.state)
         return None
 
     @property
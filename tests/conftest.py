@@ -0,0 +1,33 @@
+"""Make the integration's pure modules importable without Home Assistant.
+
+When homeassistant is not installed, the few names the tested modules
+import are stubbed. The package __init__, which needs Home Assistant,
+voluptuous and pymodbus, is bypassed, so only the submodules under test
+are loaded.
+"""
+import importlib.util
+import os
+import sys
+import types
+
+PACKAGE = "custom_components.solaredge_modbus"
+PACKAGE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "custom_components",
+    "solaredge_modbus",
+)
+
+
+def _module(name, **attrs):
+    mod = types.ModuleType(name)
+    mod.__dict__.update(attrs)
+    sys.modules[name] = mod
+    return mod
+
+
+if importlib.util.find_spec("homeassistant") is None:
+    _module("homeassistant")
+    _module("homeassistant.core", callback=lambda func: func)
+    _dt = _module("homeassistant.util.dt")
+    _module("homeassistant.util", dt=_dt, slugify=lambda text: text.lower())
+    _module(PACKAGE, __path__=[PACKAGE_DIR])
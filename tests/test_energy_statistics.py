@@ -0,0 +1,72 @@
+"""Tests for the hourly energy counter statistics."""
+from datetime import datetime, timedelta, timezone
+
+from custom_components.solaredge_modbus.energy_statistics import EnergyCounter
+
+
+def at(hour, minute=0):
+    """Return a UTC moment on the test day."""
+    return datetime(2024, 1, 1, hour, minute, tzinfo=timezone.utc)
+
+
+def row(hour, state, total):
+    """Return the statistic row expected for an hour."""
+    return {"start": at(hour), "state": state, "sum": total}
+
+
+def test_first_sample_only_sets_the_baseline():
+    counter = EnergyCounter("solaredge_modbus:solaredge_acenergy")
+    assert counter.add_sample(at(10, 30), 100.0) == []
+    assert counter.add_sample(at(10, 30), 101.0) == []
+
+
+def test_hour_boundary_splits_the_delta():
+    counter = EnergyCounter("solaredge_modbus:solaredge_acenergy")
+    counter.add_sample(at(10, 30), 100.0)
+    assert counter.add_sample(at(10, 50), 101.0) == []
+    assert counter.add_sample(at(11, 10), 102.0) == [row(10, 101.5, 1.5)]
+
+
+def test_outage_is_backfilled_per_hour():
+    counter = EnergyCounter("solaredge_modbus:solaredge_acenergy")
+    counter.add_sample(at(10, 30), 100.0)
+    assert counter.add_sample(at(13, 30), 103.0) == [
+        row(10, 100.5, 0.5),
+        row(11, 101.5, 1.5),
+        row(12, 102.5, 2.5),
+    ]
+    assert counter.add_sample(at(14), 103.0) == [row(13, 103.0, 3.0)]
+
+
+def test_zero_reading_is_ignored():
+    counter = EnergyCounter("solaredge_modbus:solaredge_acenergy")
+    counter.add_sample(at(10, 30), 100.0)
+    assert counter.add_sample(at(10, 40), 0) == []
+    assert counter.add_sample(at(11, 10), 101.0) == [row(10, 100.75, 0.75)]
+
+
+def test_reset_counts_the_new_value_from_the_start_of_the_gap():
+    counter = EnergyCounter("solaredge_modbus:solaredge_acenergy")
+    counter.add_sample(at(10, 30), 100.0)
+    assert counter.add_sample(at(12, 30), 2.0) == [
+        row(10, 0.5, 0.5),
+        row(11, 1.5, 1.5),
+    ]
+
+
+def test_rollover_wraps_at_the_limit():
+    counter = EnergyCounter("solaredge_modbus:solaredge_acenergy")
+    counter.add_sample(at(10, 30), 990.0, 1000.0)
+    assert counter.add_sample(at(11, 30), 10.0, 1000.0) == [row(10, 0.0, 10.0)]
+    assert counter.add_sample(at(12), 10.0, 1000.0) == [row(11, 10.0, 20.0)]
+
+
+def test_restore_backfills_from_the_last_imported_hour():
+    counter = EnergyCounter("solaredge_modbus:solaredge_acenergy")
+    counter.restore(at(10), 100.0, 50.0)
+    assert counter.add_sample(at(12, 30), 103.0) == [
+        row(11, 102.0, 52.0),
+    ]
+    assert counter.add_sample(at(13) + timedelta(seconds=1), 103.0) == [
+        row(12, 103.0, 53.0),
+    ]